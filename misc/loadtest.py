@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" Load test for the scoring server: `python -m password_strength serve`
+
+    Sends POST /test requests from concurrent keep-alive connections and reports latency and throughput:
+
+        python misc/loadtest.py --port 8080 --concurrency 32 --duration 10
+"""
+
+from __future__ import print_function, division
+
+import json
+import time
+import random
+import argparse
+import threading
+from six.moves import http_client
+
+
+def worker(host, port, deadline, passwords, latencies, errors):
+    conn = http_client.HTTPConnection(host, port)
+    headers = {'Content-Type': 'application/json'}
+    while time.time() < deadline:
+        body = json.dumps({'password': random.choice(passwords)})
+        started = time.time()
+        try:
+            conn.request('POST', '/test', body, headers)
+            response = conn.getresponse()
+            response.read()
+        except (http_client.HTTPException, IOError):
+            errors.append(1)
+            conn.close()
+            conn = http_client.HTTPConnection(host, port)
+            continue
+        latencies.append(time.time() - started)
+        if response.status != 200:
+            errors.append(1)
+    conn.close()
+
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--concurrency', type=int, default=16, help='Number of concurrent connections')
+    parser.add_argument('--duration', type=float, default=10, help='Test duration, seconds')
+    args = parser.parse_args()
+
+    passwords = ['qwerty', 'qazwsxrfvTG94@$', 'correcthorsebatterystaple', 'V3ryG00dPassw0rd?!', u'Mixed-汉堡包/漢堡包']
+    latencies, errors = [], []  # list.append() is thread-safe
+
+    started = time.time()
+    threads = [threading.Thread(target=worker, args=(args.host, args.port, started + args.duration, passwords, latencies, errors))
+               for i in range(args.concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - started
+
+    if not latencies:
+        raise SystemExit('No successful requests; is the server running?')
+    latencies.sort()
+    print('requests:  {}'.format(len(latencies)))
+    print('errors:    {}'.format(len(errors)))
+    print('req/s:     {:.0f}'.format(len(latencies) / elapsed))
+    print('p50:       {:.2f} ms'.format(percentile(latencies, 50) * 1000))
+    print('p99:       {:.2f} ms'.format(percentile(latencies, 99) * 1000))
+
+
+if __name__ == '__main__':
+    main()
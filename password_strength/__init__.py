@@ -1,3 +1,4 @@
 from .stats import PasswordStats
 from .policy import PasswordPolicy
+from .snapshot import StatsSnapshot
 from . import tests
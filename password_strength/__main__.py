@@ -0,0 +1,40 @@
+""" Command-line interface
+
+    python -m password_strength serve --policy '{"length": 8}'
+"""
+
+import json
+import argparse
+import multiprocessing
+
+from .policy import PasswordPolicy
+from . import server
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m password_strength', description='Password strength and validation')
+    commands = parser.add_subparsers(dest='command')
+
+    serve = commands.add_parser('serve', help='Run the HTTP/JSON scoring server')
+    serve.add_argument('--policy', default='{}',
+                       help='Policy tests as JSON, passed to PasswordPolicy.from_names(). Example: {"length": 8, "strength": [0.33, 30]}')
+    serve.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: %(default)s)')
+    serve.add_argument('--port', type=int, default=8080, help='Port to listen on (default: %(default)s)')
+    serve.add_argument('--workers', type=int, default=multiprocessing.cpu_count(), help='Number of worker processes (default: %(default)s)')
+    serve.add_argument('--max-batch', type=int, default=64, help='Max passwords per micro-batch (default: %(default)s)')
+    serve.add_argument('--max-delay', type=float, default=0, help='Max seconds to wait for a micro-batch to fill up; 0 to only batch requests that are already queued (default: %(default)s)')
+
+    args = parser.parse_args(args)
+    if args.command != 'serve':
+        parser.error('No command given')
+
+    try:
+        policy = PasswordPolicy.from_names(**json.loads(args.policy))
+    except (ValueError, TypeError, KeyError) as e:
+        parser.error('Invalid --policy: {!r}'.format(e))
+
+    server.serve(policy, args.host, args.port, args.workers, args.max_batch, args.max_delay)
+
+
+if __name__ == '__main__':
+    main()
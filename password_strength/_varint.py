@@ -0,0 +1,30 @@
+""" LEB128 varints: compact encoding of unsigned integers for binary formats """
+
+
+def write_varint(data, value):
+    """ Append an unsigned integer as a LEB128 varint
+
+    :type data: bytearray
+    :type value: int
+    """
+    while value > 0x7F:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def read_varint(data, pos):
+    """ Read a LEB128 varint at position `pos`
+
+    :type data: bytearray
+    :return: (value, end position)
+    :raises IndexError: truncated data
+    """
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, pos
@@ -0,0 +1,227 @@
+""" Estimate how a policy would fare on a password corpus, without scanning all of it.
+
+    A random sample of the corpus is tested with the policy, and the results are reported
+    as estimates with confidence intervals. Sampling stops as soon as the target precision is reached.
+"""
+
+from __future__ import division
+
+import random as _random
+from math import log, sqrt, erf, floor
+from collections import namedtuple
+from itertools import islice
+
+from .report import AuditReport
+
+
+#: An estimated value with its confidence interval
+Estimate = namedtuple('Estimate', ('value', 'low', 'high'))
+
+
+def reservoir_sample(iterable, k, random=_random):
+    """ Get a uniform random sample of `k` items from an iterable of unknown length, in a single pass
+
+    Uses Algorithm L: the number of items to skip is computed directly, so the cost is O(k * log(n / k)) random numbers.
+
+    :param iterable: Items to sample from
+    :type iterable: Iterable
+    :param k: Sample size
+    :type k: int
+    :param random: Random number generator
+    :type random: random.Random
+    :return: Sample of `k` items, or all items if there are less than `k` of them
+    :rtype: list
+    """
+    it = iter(iterable)
+    sample = list(islice(it, k))
+    if len(sample) < k or k == 0:
+        return sample
+
+    w = _nonzero_random(random) ** (1 / k)
+    while True:
+        skip = int(floor(log(_nonzero_random(random)) / log(1 - w)))
+        item = next(islice(it, skip, None), _END)
+        if item is _END:
+            return sample
+        sample[random.randrange(k)] = item
+        w *= _nonzero_random(random) ** (1 / k)
+
+
+class SamplingAudit(object):
+    """ Estimate per-test failure rates and the strength distribution of a policy on a corpus.
+
+        Example:
+
+            audit = SamplingAudit(policy, precision=0.01).run(line.rstrip('\\n') for line in open('corpus.txt'))
+            audit.failure_rates()  # -> {'length': Estimate(value=0.21, low=0.20, high=0.22), ...}
+
+        Proportions are estimated with Wilson score intervals, the mean strength with a normal interval.
+        The sample itself is aggregated into an `AuditReport`: `audit.report`.
+    """
+
+    def __init__(self, policy, precision=0.01, confidence=0.95, min_samples=100, bins=10, weak_bits=30):
+        """ Init the audit
+
+        :param policy: The policy to estimate
+        :type policy: password_strength.PasswordPolicy
+        :param precision: Target half-width of confidence intervals of all estimated proportions
+        :type precision: float
+        :param confidence: Confidence level of intervals
+        :type confidence: float
+        :param min_samples: Never consider estimates precise on fewer samples
+        :type min_samples: int
+        :param bins: Number of bins in the strength distribution
+        :type bins: int
+        :param weak_bits: `weak_bits` for `PasswordStats.strength()`
+        :type weak_bits: int
+        """
+        self.policy = policy
+        self.precision = precision
+        self.confidence = confidence
+        self.min_samples = min_samples
+        self.bins = bins
+        self.weak_bits = weak_bits
+
+        self._z = _normal_quantile(confidence)
+
+        #: Aggregated sample
+        self.report = AuditReport(weak_bits=weak_bits, strength_bins=bins)
+        #: Number of passwords that failed at least one test
+        self.rejected = 0
+        self._strength_sum = self._strength_sum2 = 0.0
+
+    @property
+    def samples(self):
+        """ Number of tested passwords
+
+        :rtype: int
+        """
+        return self.report.count
+
+    def add(self, password):
+        """ Test a sampled password
+
+        :param password: Passphrase
+        :type password: str|unicode
+        """
+        stats = self.policy.password(password)
+        failed = stats.test()
+        self.report.add(stats, failed)
+
+        strength = stats.strength(self.weak_bits)
+        if failed:
+            self.rejected += 1
+        self._strength_sum += strength
+        self._strength_sum2 += strength * strength
+
+    def run(self, passwords, rate=1.0, random=_random):
+        """ Sample passwords from a corpus until the estimates are precise enough, or the corpus is exhausted
+
+        Every password is sampled with probability `rate`: with a low rate, the sample spreads over
+        a larger part of the corpus, which matters if the corpus is not shuffled.
+        Skipped passwords are not analyzed at all.
+
+        :param passwords: The corpus
+        :type passwords: Iterable[str|unicode]
+        :param rate: Sampling probability, (0 .. 1]
+        :type rate: float
+        :param random: Random number generator
+        :type random: random.Random
+        :return: self
+        :rtype: SamplingAudit
+        """
+        assert 0 < rate <= 1, 'Sampling rate should be in range (0 .. 1]'
+        it = iter(passwords)
+        while True:
+            # Bernoulli sampling: skip a geometrically distributed number of items
+            skip = 0 if rate == 1 else int(floor(log(_nonzero_random(random)) / log(1 - rate)))
+            password = next(islice(it, skip, None), _END)
+            if password is _END:
+                return self
+            self.add(password)
+
+            # Checking precision is costlier than testing a password: do it once in a while
+            if self.samples % 100 == 0 and self.precise:
+                return self
+
+    @property
+    def precise(self):
+        """ Whether all estimated proportions are within the target precision
+
+        :rtype: bool
+        """
+        if self.samples < self.min_samples:
+            return False
+        estimates = [self.rejection_rate()] + list(self.failure_rates().values()) + self.strength_distribution()
+        return all((e.high - e.low) / 2 <= self.precision for e in estimates)
+
+    def rejection_rate(self):
+        """ Estimate the portion of passwords that fail at least one test
+
+        :rtype: Estimate
+        """
+        return self._proportion(self.rejected)
+
+    def failure_rates(self):
+        """ Estimate the portion of passwords that fail each test
+
+        :returns: { test-name: Estimate }
+        :rtype: dict
+        """
+        return {t.name(): self._proportion(self.report.failures[t.name()]) for t in self.policy._tests}
+
+    def strength_distribution(self):
+        """ Estimate the portion of passwords in each strength bin
+
+        Bin `i` covers strength in range [i/bins .. (i+1)/bins).
+
+        :rtype: list[Estimate]
+        """
+        return [self._proportion(n) for n in self.report.strength.counts]
+
+    def mean_strength(self):
+        """ Estimate the mean password strength
+
+        :rtype: Estimate
+        """
+        n = self.samples
+        if n == 0:
+            return Estimate(0.0, 0.0, 1.0)
+        mean = self._strength_sum / n
+        variance = max(0.0, self._strength_sum2 / n - mean * mean) * n / max(1, n - 1)
+        half = self._z * sqrt(variance / n)
+        return Estimate(mean, mean - half, mean + half)
+
+    def _proportion(self, k):
+        """ Wilson score interval for `k` successes out of `samples` """
+        n = self.samples
+        if n == 0:
+            return Estimate(0.0, 0.0, 1.0)
+        z2 = self._z * self._z
+        p = k / n
+        center = (p + z2 / (2 * n)) / (1 + z2 / n)
+        half = self._z * sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+        return Estimate(p, max(0.0, center - half), min(1.0, center + half))
+
+
+_END = object()
+
+
+def _nonzero_random(random):
+    """ Uniform random number in range (0 .. 1): both ends excluded, so it's safe to take log() of it and its complement """
+    while True:
+        r = random.random()
+        if r > 0:
+            return r
+
+
+def _normal_quantile(confidence):
+    """ Get `z` such that a standard normal variable is within [-z .. z] with probability `confidence` """
+    low, high = 0.0, 10.0
+    for _ in range(60):  # bisection: plenty for a double
+        z = (low + high) / 2
+        if erf(z / sqrt(2)) < confidence:
+            low = z
+        else:
+            high = z
+    return (low + high) / 2
@@ -0,0 +1,89 @@
+""" Bounded edit distance with a bit-parallel algorithm.
+
+    Levenshtein distance is computed with Myers' bit-vector algorithm (in Hyyro's formulation):
+    a whole column of the dynamic programming matrix is updated with a handful of integer operations.
+    Python integers have arbitrary precision, so patterns of any length are supported.
+"""
+
+
+class Pattern(object):
+    """ A string prepared for computing edit distances to other strings.
+
+        Prepare the password once, and compare it to as many strings as needed.
+    """
+
+    def __init__(self, pattern):
+        """ Prepare a pattern
+
+        :param pattern: The string to compare other strings with
+        :type pattern: str|unicode
+        """
+        self.length = len(pattern)
+
+        # Match masks: bit `i` is set if `pattern[i] == char`
+        self._peq = {}
+        for i, char in enumerate(pattern):
+            self._peq[char] = self._peq.get(char, 0) | (1 << i)
+
+    def distance(self, text, max_distance=None):
+        """ Get the Levenshtein distance between the pattern and a string
+
+        When `max_distance` is given, the computation stops as soon as the distance is known to reach it.
+
+        :param text: The string to compare with
+        :type text: str|unicode
+        :param max_distance: Stop counting at this distance
+        :type max_distance: int|None
+        :return: Edit distance, or `max_distance` if the distance is not less than that
+        :rtype: int
+        """
+        m, n = self.length, len(text)
+        bound = max_distance if max_distance is not None else max(m, n)
+
+        # Trivial cases: the distance is at least the difference in length
+        if abs(m - n) >= bound:
+            return bound
+        if m == 0:
+            return n
+
+        peq = self._peq
+        full = (1 << m) - 1
+        last = 1 << (m - 1)
+
+        # Vertical deltas of the current column: +1 (pv) and -1 (mv)
+        pv, mv = full, 0
+        score = m
+        for j, char in enumerate(text):
+            eq = peq.get(char, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            # Horizontal deltas: +1 (ph) and -1 (mh)
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            ph = ((ph << 1) | 1) & full  # the top row grows by 1 per column: global distance
+            mh = (mh << 1) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+
+            # Every remaining column may decrease the score by at most 1
+            if score - (n - j - 1) >= bound:
+                return bound
+
+        return min(score, bound)
+
+
+def edit_distance(a, b, max_distance=None):
+    """ Get the Levenshtein distance between two strings
+
+    :type a: str|unicode
+    :type b: str|unicode
+    :param max_distance: Stop counting at this distance
+    :type max_distance: int|None
+    :return: Edit distance, or `max_distance` if the distance is not less than that
+    :rtype: int
+    """
+    return Pattern(a).distance(b, max_distance)
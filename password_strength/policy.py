@@ -1,4 +1,5 @@
 from .stats import PasswordStats
+from .snapshot import StatsSnapshot
 from . import tests as _tests
 
 
@@ -64,17 +65,69 @@ class PasswordPolicy(object):
         """
         return BoundPasswordStats(password, self)
 
-    def test(self, password):
+    def test(self, password, **context):
         """ Perform tests on a password.
 
-        Shortcut for: `PasswordPolicy.password(password).test()`.
+        Shortcut for: `PasswordPolicy.password(password).test(**context)`.
 
         :param password: Passphrase
         :type password: str|unicode
+        :param context: Additional data for tests that need it, e.g. `history=[...]` for `tests.EditDistance`
         :return: List of tests that have failed
         :rtype: list[password_strength.tests.ATest]
         """
-        return self.password(password).test()
+        return self.password(password).test(**context)
+
+    def test_many(self, passwords, return_exceptions=False):
+        """ Perform tests on a batch of passwords.
+
+        This is the batch evaluation path: the list of tests is resolved once,
+        and every password is scored in a tight loop.
+
+        :param passwords: Passphrases
+        :type passwords: Iterable[str|unicode]
+        :param return_exceptions: Yield the exception in place of the result if a password fails with one,
+            and go on with the rest of the batch. By default, the exception is raised.
+        :type return_exceptions: bool
+        :return: Iterator over lists of tests that have failed, one per password, in order
+        :rtype: Iterable[list[password_strength.tests.ATest]|Exception]
+        """
+        tests = self._tests
+        for password in passwords:
+            try:
+                result = PasswordStats(password).test(tests)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                result = e
+            yield result
+
+    def test_snapshots(self, snapshots):
+        """ Perform tests on stored password stats snapshots.
+
+        This lets you re-evaluate a tightened policy against passwords you no longer have:
+        only numeric work is done, so it's fast enough for bulk audits.
+
+        Only tests that rely on the numbers stored in a snapshot can be used.
+        Tests that need the password itself (`ATest.needs_password`, e.g. `tests.EditDistance`) are rejected.
+
+        :param snapshots: Snapshots, or their serialized form (see `StatsSnapshot.dumps()`)
+        :type snapshots: Iterable[StatsSnapshot|bytes]
+        :return: Iterator over lists of tests that have failed, one per snapshot, in order
+        :rtype: Iterable[list[password_strength.tests.ATest]]
+        :raises ValueError: the policy has tests that need the password
+        """
+        unsupported = [t for t in self._tests if t.needs_password]
+        if unsupported:
+            raise ValueError('Tests need the password, and cannot be used on snapshots: {}'.format(unsupported))
+        return self._test_snapshots(snapshots)
+
+    def _test_snapshots(self, snapshots):
+        tests = self._tests
+        for snapshot in snapshots:
+            if not isinstance(snapshot, StatsSnapshot):
+                snapshot = StatsSnapshot.loads(snapshot)
+            yield snapshot.test(tests)
 
 
 class BoundPasswordStats(PasswordStats):
@@ -84,5 +137,5 @@ class BoundPasswordStats(PasswordStats):
         self._policy = policy
         super(BoundPasswordStats, self).__init__(password)
 
-    def test(self):
-        return super(BoundPasswordStats, self).test(self._policy._tests)
+    def test(self, **context):
+        return super(BoundPasswordStats, self).test(self._policy._tests, **context)
@@ -0,0 +1,307 @@
+""" Aggregate reports that can be merged across workers and nodes.
+
+    Every worker fills its own `AuditReport` with constant memory, serializes it with `dumps()`,
+    and the results are reduced in any order:
+
+        report = reduce(operator.add, map(AuditReport.loads, shards))
+"""
+
+from __future__ import division
+
+import struct
+from collections import Counter
+
+from ._varint import write_varint, read_varint
+
+
+class Histogram(object):
+    """ Histogram with fixed bins.
+
+        Values are counted in `bins` equal bins in range [low .. high).
+        Values outside of the range are counted in the first and the last bins.
+
+        Histograms with the same bins can be merged.
+    """
+
+    def __init__(self, low, high, bins, counts=None):
+        """ Init an empty histogram
+
+        :param low: Lower bound of the first bin
+        :type low: float
+        :param high: Upper bound of the last bin
+        :type high: float
+        :param bins: Number of bins
+        :type bins: int
+        :param counts: Initial counts per bin
+        :type counts: list[int]|None
+        """
+        assert high > low and bins > 0, 'Histogram needs a non-empty range'
+        self.low = float(low)
+        self.high = float(high)
+        self.bins = bins
+        self.counts = list(counts) if counts is not None else [0] * bins
+        assert len(self.counts) == bins, 'Histogram needs a count for every bin'
+
+    @property
+    def total(self):
+        """ Total number of values
+
+        :rtype: int
+        """
+        return sum(self.counts)
+
+    def add(self, value, n=1):
+        """ Count a value
+
+        :type value: float
+        :param n: Number of times to count it
+        :type n: int
+        """
+        i = int((value - self.low) * self.bins / (self.high - self.low))
+        self.counts[min(max(i, 0), self.bins - 1)] += n
+
+    def quantile(self, q):
+        """ Estimate a quantile, assuming that values are spread evenly within a bin
+
+        :param q: Quantile, in range {0 .. 1}
+        :type q: float
+        :rtype: float|None
+        """
+        total = self.total
+        if not total:
+            return None
+
+        width = (self.high - self.low) / self.bins
+        target = q * total
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= target:
+                return self.low + width * (i + (target - seen) / n)
+            seen += n
+        return self.high
+
+    def merge(self, other):
+        """ Get a histogram with counts from both
+
+        :type other: Histogram
+        :rtype: Histogram
+        :raises ValueError: the histograms have different bins
+        """
+        if (self.low, self.high, self.bins) != (other.low, other.high, other.bins):
+            raise ValueError('Cannot merge histograms with different bins')
+        return Histogram(self.low, self.high, self.bins, [a + b for a, b in zip(self.counts, other.counts)])
+
+    __add__ = merge
+
+    def _dump(self, data):
+        data.extend(struct.pack('<dd', self.low, self.high))
+        write_varint(data, self.bins)
+        for n in self.counts:
+            write_varint(data, n)
+
+    @classmethod
+    def _load(cls, data, pos):
+        if len(data) < pos + 16:
+            raise ValueError('Truncated AuditReport')
+        low, high = struct.unpack('<dd', bytes(data[pos:pos + 16]))
+        bins, pos = read_varint(data, pos + 16)
+        if not (low < high and bins > 0):
+            raise ValueError('Malformed AuditReport')
+        counts = []
+        for _ in range(bins):
+            n, pos = read_varint(data, pos)
+            counts.append(n)
+        return cls(low, high, bins, counts), pos
+
+    def __eq__(self, other):
+        return isinstance(other, Histogram) and \
+               (self.low, self.high, self.bins, self.counts) == (other.low, other.high, other.bins, other.counts)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Histogram({}, {}, {}, total={})'.format(self.low, self.high, self.bins, self.total)
+
+
+class AuditReport(object):
+    """ Aggregate statistics on tested passwords.
+
+        Collects:
+
+        * `failures`: number of passwords that failed a test, per test name
+        * `strength`, `entropy_bits`, `length`: histograms of these statistics
+        * `char_categories`: number of characters in every top-level unicode category
+
+        Memory use does not depend on the number of passwords.
+        Reports are merged with `merge()` (or `+`): merging is associative and commutative,
+        so shards can be reduced in any order.
+    """
+
+    MAGIC = b'PR'
+    VERSION = 1
+
+    def __init__(self, weak_bits=30, strength_bins=20, max_entropy_bits=256, entropy_bits_bins=64, max_length=128):
+        """ Init an empty report
+
+        Reports can only be merged if they were created with the same arguments.
+
+        :param weak_bits: `weak_bits` for `PasswordStats.strength()`
+        :type weak_bits: int|float
+        :param strength_bins: Number of bins in the strength histogram
+        :type strength_bins: int
+        :param max_entropy_bits: Upper bound of the entropy bits histogram
+        :type max_entropy_bits: int
+        :param entropy_bits_bins: Number of bins in the entropy bits histogram
+        :type entropy_bits_bins: int
+        :param max_length: Upper bound of the length histogram; every length gets its own bin
+        :type max_length: int
+        """
+        self.weak_bits = weak_bits
+
+        #: Number of passwords
+        self.count = 0
+        #: Failure counts: { test-name: number of passwords }. Tests with the same name count once per password
+        self.failures = Counter()
+        #: Histogram of `PasswordStats.strength()`
+        self.strength = Histogram(0, 1, strength_bins)
+        #: Histogram of `PasswordStats.entropy_bits`
+        self.entropy_bits = Histogram(0, max_entropy_bits, entropy_bits_bins)
+        #: Histogram of `PasswordStats.length`
+        self.length = Histogram(0, max_length, max_length)
+        #: Character counts: { top-level-category: count }
+        self.char_categories = Counter()
+
+    def add(self, stats, failed=()):
+        """ Add a password to the report
+
+        :param stats: Password stats
+        :type stats: password_strength.PasswordStats
+        :param failed: Tests that have failed
+        :type failed: Iterable[password_strength.tests.ATest]
+        """
+        self.count += 1
+        self.failures.update(set(t.name() for t in failed))
+        self.strength.add(stats.strength(self.weak_bits))
+        self.entropy_bits.add(stats.entropy_bits)
+        self.length.add(stats.length)
+        self.char_categories.update(stats.char_categories)
+
+    def add_passwords(self, policy, passwords):
+        """ Test passwords with a policy, and add them to the report
+
+        :type policy: password_strength.PasswordPolicy
+        :type passwords: Iterable[str|unicode]
+        :return: self
+        :rtype: AuditReport
+        """
+        for password in passwords:
+            stats = policy.password(password)
+            self.add(stats, stats.test())
+        return self
+
+    def merge(self, other):
+        """ Get a report that combines both
+
+        :type other: AuditReport
+        :rtype: AuditReport
+        :raises ValueError: the reports were created with different arguments
+        """
+        if self.weak_bits != other.weak_bits:
+            raise ValueError('Cannot merge reports with different weak_bits')
+
+        report = AuditReport.__new__(AuditReport)
+        report.weak_bits = self.weak_bits
+        report.count = self.count + other.count
+        report.failures = self.failures + other.failures
+        report.strength = self.strength + other.strength
+        report.entropy_bits = self.entropy_bits + other.entropy_bits
+        report.length = self.length + other.length
+        report.char_categories = self.char_categories + other.char_categories
+        return report
+
+    __add__ = merge
+
+    def dumps(self):
+        """ Serialize the report
+
+        :rtype: bytes
+        """
+        data = bytearray(self.MAGIC)
+        data.append(self.VERSION)
+        data.extend(struct.pack('<d', self.weak_bits))
+        write_varint(data, self.count)
+        for counter in (self.failures, self.char_categories):
+            write_varint(data, len(counter))
+            for key, n in sorted(counter.items()):
+                key = key.encode('utf-8')
+                write_varint(data, len(key))
+                data.extend(key)
+                write_varint(data, n)
+        for histogram in (self.strength, self.entropy_bits, self.length):
+            histogram._dump(data)
+        return bytes(data)
+
+    @classmethod
+    def loads(cls, data):
+        """ Load a report serialized with `dumps()`
+
+        :type data: bytes
+        :rtype: AuditReport
+        :raises ValueError: malformed data
+        """
+        data = bytearray(data)
+        if len(data) < 3:
+            raise ValueError('Truncated AuditReport')
+        if bytes(data[:2]) != cls.MAGIC:
+            raise ValueError('Not an AuditReport')
+        if data[2] != cls.VERSION:
+            raise ValueError('Unsupported AuditReport version: {}'.format(data[2]))
+
+        try:
+            report, pos = cls._load(data)
+        except IndexError:
+            raise ValueError('Truncated AuditReport')
+
+        if pos != len(data):
+            raise ValueError('Trailing data after AuditReport')
+        return report
+
+    @classmethod
+    def _load(cls, data):
+        """ Load a report from `data`, after the header
+
+        :type data: bytearray
+        :return: (report, end position)
+        :raises IndexError: truncated data
+        """
+        report = cls.__new__(cls)
+        if len(data) < 11:
+            raise ValueError('Truncated AuditReport')
+        report.weak_bits, = struct.unpack('<d', bytes(data[3:11]))
+        report.count, pos = read_varint(data, 11)
+        counters = []
+        for _ in range(2):
+            counter = Counter()
+            size, pos = read_varint(data, pos)
+            for _ in range(size):
+                key_length, pos = read_varint(data, pos)
+                if len(data) < pos + key_length:
+                    raise ValueError('Truncated AuditReport')
+                key = bytes(data[pos:pos + key_length]).decode('utf-8')
+                counter[key], pos = read_varint(data, pos + key_length)
+            counters.append(counter)
+        report.failures, report.char_categories = counters
+        report.strength, pos = Histogram._load(data, pos)
+        report.entropy_bits, pos = Histogram._load(data, pos)
+        report.length, pos = Histogram._load(data, pos)
+        return report, pos
+
+    def __eq__(self, other):
+        return isinstance(other, AuditReport) and self.dumps() == other.dumps()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'AuditReport(count={}, failures={})'.format(self.count, dict(self.failures))
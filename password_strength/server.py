@@ -0,0 +1,324 @@
+""" Local HTTP/JSON scoring server.
+
+    Lets services written in other languages share the same password policy:
+
+        python -m password_strength serve --policy '{"length": 8, "strength": [0.33, 30]}'
+
+    Endpoints:
+
+    * `POST /test` with `{"password": "..."}` -> `{"failed": ["length", ...]}`,
+      or with `{"passwords": [...]}` -> `{"failed": [[...], ...]}`
+    * `GET /health` -> `{"status": "ok"}`
+    * `GET /metrics` -> counters in Prometheus text format, summed over all workers
+
+    The listening socket is opened once and shared by a pool of pre-forked worker processes.
+    Within a worker, requests that queue up while a batch is being scored are scored together with `PasswordPolicy.test_many()`.
+"""
+
+import os
+import json
+import time
+import signal
+import threading
+import multiprocessing
+import six
+from six.moves import BaseHTTPServer, socketserver, queue
+
+
+class Metrics(object):
+    """ Counters shared between worker processes.
+
+        Created before forking, so every worker updates the same memory.
+    """
+
+    #: Counter names, in storage order
+    fields = ('requests', 'passwords', 'batches', 'errors', 'latency_seconds')
+
+    def __init__(self):
+        self._values = multiprocessing.RawArray('d', len(self.fields))
+        self._lock = multiprocessing.Lock()
+
+    def add(self, **counters):
+        """ Increment counters by the given amounts """
+        with self._lock:
+            for name, value in counters.items():
+                self._values[self.fields.index(name)] += value
+
+    def snapshot(self):
+        """ Get current counter values
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(zip(self.fields, self._values))
+
+    def render(self):
+        """ Render counters in Prometheus text format
+
+        :rtype: str
+        """
+        return ''.join(
+            'password_strength_{name}_total {value:g}\n'.format(name=name, value=value)
+            for name, value in sorted(self.snapshot().items())
+        )
+
+
+class _Job(object):
+    """ A batch of passwords submitted by a single request """
+
+    def __init__(self, passwords):
+        self.passwords = passwords
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class Batcher(object):
+    """ Collects passwords from concurrent requests into micro-batches.
+
+        A single thread pulls jobs off the queue: it takes every job that is already queued,
+        up to `max_batch` passwords, and scores them in one `PasswordPolicy.test_many()` call.
+        With a positive `max_delay`, it also waits that long for more jobs to join the batch:
+        this only pays off if the policy gets cheaper per password in larger batches.
+        A password that breaks a test only fails its own request.
+    """
+
+    def __init__(self, policy, max_batch=64, max_delay=0, metrics=None):
+        """ Init the batcher
+
+        :param policy: The policy to test passwords with
+        :type policy: password_strength.PasswordPolicy
+        :param max_batch: Max number of passwords in a batch
+        :type max_batch: int
+        :param max_delay: Max number of seconds to wait for more requests to join a batch; 0 to never wait
+        :type max_delay: float
+        :param metrics: Counters to update
+        :type metrics: Metrics|None
+        """
+        self.policy = policy
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.metrics = metrics
+
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """ Start the batching thread """
+        self._thread = threading.Thread(target=self._run, name='password-strength-batcher')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """ Stop the batching thread """
+        self._queue.put(None)
+        self._thread.join()
+
+    def submit(self, passwords):
+        """ Test passwords, blocking until their batch is processed
+
+        :param passwords: Passphrases
+        :type passwords: list[str|unicode]
+        :return: List of failed tests for every password
+        :rtype: list[list[password_strength.tests.ATest]]
+        """
+        job = _Job(passwords)
+        self._queue.put(job)
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            # Collect more jobs: those already queued, and those arriving within `max_delay`
+            jobs = [job]
+            size = len(job.passwords)
+            deadline = time.time() + self.max_delay
+            while size < self.max_batch:
+                timeout = deadline - time.time()
+                try:
+                    job = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._queue.put(None)  # put it back: will stop after this batch
+                    break
+                jobs.append(job)
+                size += len(job.passwords)
+
+            self._process(jobs)
+
+    def _process(self, jobs):
+        passwords = [password for job in jobs for password in job.passwords]
+        results = list(self.policy.test_many(passwords, return_exceptions=True))
+
+        # Split results back: a password that breaks a test only fails its own request
+        pos = 0
+        for job in jobs:
+            job.result = results[pos:pos + len(job.passwords)]
+            pos += len(job.passwords)
+            job.error = next((r for r in job.result if isinstance(r, Exception)), None)
+            job.done.set()
+
+        if self.metrics is not None:
+            self.metrics.add(batches=1, passwords=sum(len(job.passwords) for job in jobs))
+
+
+class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """ HTTP/JSON API handler """
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    server_version = 'password_strength'
+    disable_nagle_algorithm = True  # responses are tiny: don't wait for delayed ACKs
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok', 'pid': os.getpid()})
+        elif self.path == '/metrics':
+            self._send(200, self.server.metrics.render(), content_type='text/plain; version=0.0.4')
+        else:
+            self._send(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if self.path != '/test':
+            return self._send(404, {'error': 'Not found'})
+
+        started = time.time()
+        passwords, single = self._read_passwords()
+        if passwords is None:
+            self.server.metrics.add(requests=1, errors=1)
+            self.close_connection = True  # the body may not have been read
+            return self._send(400, {'error': 'Expected JSON: {"password": str} or {"passwords": [str]}'})
+
+        try:
+            results = self.server.batcher.submit(passwords)
+        except Exception as e:
+            self.server.metrics.add(requests=1, errors=1)
+            return self._send(500, {'error': str(e)})
+
+        failed = [[t.name() for t in result] for result in results]
+        self._send(200, {'failed': failed[0] if single else failed})
+        self.server.metrics.add(requests=1, latency_seconds=time.time() - started)
+
+    def _read_passwords(self):
+        """ Read passwords from the request body
+
+        :return: (passwords, single), or (None, None) if the request is malformed
+        """
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                return None, None
+            body = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            return None, None
+
+        if not isinstance(body, dict):
+            return None, None
+        if 'password' in body:
+            passwords, single = [body['password']], True
+        else:
+            passwords, single = body.get('passwords'), False
+        if not isinstance(passwords, list) or not all(isinstance(p, six.string_types) for p in passwords):
+            return None, None
+        return passwords, single
+
+    def _send(self, code, data, content_type='application/json'):
+        body = (data if content_type != 'application/json' else json.dumps(data)).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # no access log: this is a hot path
+
+
+class ScoringServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """ HTTP server that handles every connection in a thread and scores passwords with a shared `Batcher` """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, policy, max_batch=64, max_delay=0, metrics=None):
+        BaseHTTPServer.HTTPServer.__init__(self, server_address, RequestHandler)
+        self.metrics = metrics or Metrics()
+        self.batcher = Batcher(policy, max_batch, max_delay, self.metrics)
+
+    def serve_forever(self, *args, **kwargs):
+        self.batcher.start()
+        try:
+            BaseHTTPServer.HTTPServer.serve_forever(self, *args, **kwargs)
+        finally:
+            self.batcher.stop()
+
+    def get_request(self):
+        # When the listening socket is shared by workers, it is non-blocking: another worker may win the race.
+        # accept() then fails with EAGAIN, which handle_request() ignores.
+        conn, addr = self.socket.accept()
+        conn.setblocking(True)
+        return conn, addr
+
+
+def serve(policy, host='127.0.0.1', port=8080, workers=1, max_batch=64, max_delay=0):
+    """ Run the scoring server until interrupted
+
+    :param policy: The policy to test passwords with
+    :type policy: password_strength.PasswordPolicy
+    :param host: Address to listen on
+    :param port: Port to listen on
+    :param workers: Number of pre-forked worker processes. Ignored on platforms without `fork()`
+    :type workers: int
+    :param max_batch: Max number of passwords in a batch
+    :param max_delay: Max number of seconds to wait for more requests to join a batch; 0 to never wait
+    """
+    server = ScoringServer((host, port), policy, max_batch, max_delay)
+
+    if workers <= 1 or not hasattr(os, 'fork'):
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    # Pre-fork: all workers accept() on the same socket
+    server.socket.setblocking(False)
+    pids = []
+    for i in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent handles it
+            signal.signal(signal.SIGTERM, lambda signum, frame: os._exit(0))
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        pids.append(pid)
+
+    signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        for pid in pids:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        server.server_close()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
@@ -0,0 +1,155 @@
+""" Compact binary snapshots of `PasswordStats`.
+
+    A snapshot keeps only the numbers the bundled tests look at, not the password.
+    Store it at enrollment time, and re-evaluate a tightened policy later with `PasswordPolicy.test_snapshots()`.
+"""
+
+from .stats import PasswordStats
+from ._varint import write_varint, read_varint
+
+
+class StatsSnapshot(PasswordStats):
+    """ Numeric `PasswordStats` fields without the password itself.
+
+        Snapshots support all the counters that the bundled tests use,
+        and everything derived from them: `entropy_bits`, `strength()`, `weakness_factor`.
+        Anything that needs the password itself (e.g. `alphabet`, `char_categories`) is unavailable.
+
+        Binary format: 2 bytes of magic, 1 byte of version, then every field as an unsigned LEB128 varint.
+        Records are self-delimiting, so they can be simply concatenated into a stream.
+    """
+
+    MAGIC = b'PS'
+    VERSION = 1
+
+    #: Stored fields, in serialization order
+    fields = (
+        'length',
+        'alphabet_cardinality',
+        'letters',
+        'letters_uppercase',
+        'letters_lowercase',
+        'numbers',
+        'special_characters',
+        'repeated_patterns_length',
+        'sequences_length',
+    )
+    _cache_keys = tuple('__' + name for name in fields)
+
+    def __init__(self, **fields):
+        """ Init snapshot from field values
+
+        :param fields: { field-name: int }, see `StatsSnapshot.fields`
+        :raises TypeError: missing or unknown fields
+        :raises ValueError: negative values
+        """
+        if set(fields) != set(self.fields):
+            raise TypeError('StatsSnapshot fields expected: {}'.format(', '.join(self.fields)))
+
+        values = [int(fields[name]) for name in self.fields]
+        if min(values) < 0:
+            raise ValueError('StatsSnapshot fields cannot be negative')
+        self._set_values(values)
+
+    def _set_values(self, values):
+        # Pre-fill the cache of @cached_property: computed statistics won't look for the password
+        self.__dict__.update(zip(self._cache_keys, values))
+
+    @property
+    def password(self):
+        raise AttributeError('StatsSnapshot does not keep the password')
+
+    @classmethod
+    def from_stats(cls, stats):
+        """ Take a snapshot of password stats
+
+        :type stats: PasswordStats
+        :rtype: StatsSnapshot
+        """
+        return cls(**{name: getattr(stats, name) for name in cls.fields})
+
+    def values(self):
+        """ Get field values, in `StatsSnapshot.fields` order
+
+        :rtype: tuple[int]
+        """
+        return tuple(getattr(self, name) for name in self.fields)
+
+    def dumps(self):
+        """ Serialize the snapshot
+
+        :rtype: bytes
+        """
+        data = bytearray(self.MAGIC)
+        data.append(self.VERSION)
+        for value in self.values():
+            write_varint(data, value)
+        return bytes(data)
+
+    @classmethod
+    def loads(cls, data):
+        """ Load a snapshot serialized with `dumps()`
+
+        :param data: Serialized snapshot
+        :type data: bytes
+        :rtype: StatsSnapshot
+        :raises ValueError: malformed data
+        """
+        snapshot, end = cls._load(bytearray(data), 0)
+        if end != len(data):
+            raise ValueError('Trailing data after StatsSnapshot')
+        return snapshot
+
+    @classmethod
+    def iterloads(cls, data):
+        """ Load all snapshots from concatenated `dumps()` output
+
+        :param data: Serialized snapshots
+        :type data: bytes
+        :rtype: Iterable[StatsSnapshot]
+        :raises ValueError: malformed data
+        """
+        data = bytearray(data)
+        pos = 0
+        while pos < len(data):
+            snapshot, pos = cls._load(data, pos)
+            yield snapshot
+
+    @classmethod
+    def _load(cls, data, pos):
+        """ Load a snapshot from `data` at position `pos`
+
+        :type data: bytearray
+        :return: (snapshot, end position)
+        """
+        if len(data) < pos + 3:
+            raise ValueError('Truncated StatsSnapshot')
+        if bytes(data[pos:pos + 2]) != cls.MAGIC:
+            raise ValueError('Not a StatsSnapshot')
+        if data[pos + 2] != cls.VERSION:
+            raise ValueError('Unsupported StatsSnapshot version: {}'.format(data[pos + 2]))
+        pos += 3
+
+        values = []
+        try:
+            for _ in cls.fields:
+                value, pos = read_varint(data, pos)
+                values.append(value)
+        except IndexError:
+            raise ValueError('Truncated StatsSnapshot')
+
+        snapshot = cls.__new__(cls)
+        snapshot._set_values(values)
+        return snapshot, pos
+
+    def __eq__(self, other):
+        return isinstance(other, StatsSnapshot) and self.values() == other.values()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{cls}({args})'.format(
+            cls=self.__class__.__name__,
+            args=', '.join('{}={}'.format(name, value) for name, value in zip(self.fields, self.values()))
+        )
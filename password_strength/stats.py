@@ -7,10 +7,10 @@ import re
 from functools import wraps
 import sys, six
 
-try:  # Python 2
-    from itertools import izip as zip
-except ImportError:
-    pass  # Python 3
+
+def _bigrams(s):
+    """ Get the set of all 2-character substrings """
+    return frozenset(s[i:i + 2] for i in range(len(s) - 1))
 
 
 def cached_property(f):
@@ -25,14 +25,80 @@ def cached_property(f):
     return property(wrapper)
 
 
+#: Matches any non-ASCII byte
+_non_ascii_rex = re.compile(b'[\x80-\xff]')
+
+#: Unicode categories of ASCII characters
+_ascii_categories = sorted(set(unicodedata.category(six.unichr(c)) for c in range(128)))
+
+#: Translation table: ASCII character -> index of its category in `_ascii_categories`, as a byte
+_ascii_categories_table = bytes(bytearray(
+    [_ascii_categories.index(unicodedata.category(six.unichr(c))) for c in range(128)] + [0] * 128
+))
+
+#: (category, its index as a byte), for counting in a translated password
+_ascii_categories_codes = [(cat, bytes(bytearray([i]))) for i, cat in enumerate(_ascii_categories)]
+
+
 class PasswordStats(object):
     """ PasswordStats allows to calculate statistics on a password.
 
         It considers a password as a unicode string, and all statistics are unicode-based.
+
+        The password can also be given as a UTF-8 buffer: `bytes`, `bytearray` or `memoryview`.
+        If it's pure ASCII, statistics are computed on the bytes directly, without decoding.
+        Otherwise, it's decoded right away.
+        ASCII buffers are not copied: don't modify them while the stats are in use.
     """
 
+    #: Per-call context for tests, set by `test()`. See `tests.EditDistance`
+    context = {}
+
+    #: The password as an ASCII buffer, if it was given as a pure-ASCII buffer
+    _ascii = None
+    #: `_ascii` as `bytes`, made on first use: memoryview and bytearray lack some of the methods
+    _ascii_bytes = None
+
     def __init__(self, password):
-        self.password = six.text_type(password)
+        """ Analyze a password
+
+        :param password: Passphrase, or its UTF-8 buffer
+        :type password: str|unicode|bytes|bytearray|memoryview
+        :raises UnicodeDecodeError: the buffer is not valid UTF-8
+        :raises TypeError: the memoryview is not a contiguous view of bytes
+        """
+        if isinstance(password, memoryview) and (password.format != 'B' or password.strides != (1,)):
+            raise TypeError('PasswordStats needs a contiguous memoryview of bytes, got format {!r} with strides {!r}'.format(
+                password.format, password.strides))
+        if isinstance(password, (bytes, bytearray, memoryview)):
+            if _non_ascii_rex.search(password):
+                self._password = bytes(password).decode('utf-8') if isinstance(password, memoryview) else password.decode('utf-8')
+            else:
+                self._ascii = password
+                self._password = None
+                if isinstance(password, bytes):
+                    self._ascii_bytes = password
+        else:
+            self._password = six.text_type(password)
+
+    @property
+    def password(self):
+        """ The password, as a unicode string
+
+        :rtype: unicode
+        """
+        if self._password is None:
+            self._password = self._get_ascii_bytes().decode('ascii')
+        return self._password
+
+    def _get_ascii_bytes(self):
+        """ Get the ASCII buffer as `bytes`
+
+        :rtype: bytes
+        """
+        if self._ascii_bytes is None:
+            self._ascii_bytes = self._ascii.tobytes() if isinstance(self._ascii, memoryview) else bytes(self._ascii)
+        return self._ascii_bytes
 
     #region Statistics
 
@@ -42,6 +108,8 @@ class PasswordStats(object):
 
         :rtype: set
         """
+        if self._ascii is not None:
+            return set(map(six.unichr, six.iterbytes(self._get_ascii_bytes())))
         return set(self.password)
 
     @cached_property
@@ -50,6 +118,8 @@ class PasswordStats(object):
 
         :rtype: int
         """
+        if self._ascii is not None:
+            return len(set(self._ascii))
         return len(self.alphabet)
 
     @cached_property
@@ -61,6 +131,15 @@ class PasswordStats(object):
         :returns: Counter( unicode-character-category: count )
         :rtype: collections.Counter
         """
+        if self._ascii is not None:
+            # Translate characters into their categories, and count them in C
+            categories = self._get_ascii_bytes().translate(_ascii_categories_table)
+            c = Counter()
+            for cat, code in _ascii_categories_codes:
+                n = categories.count(code)
+                if n:
+                    c[cat] = n
+            return c
         return Counter(map(unicodedata.category, self.password))
 
     @cached_property
@@ -95,6 +174,8 @@ class PasswordStats(object):
 
         :rtype: int
         """
+        if self._ascii is not None:
+            return len(self._ascii)
         return len(self.password)
 
     @cached_property
@@ -175,6 +256,8 @@ class PasswordStats(object):
 
         :rtype: float
         """
+        if not self.length:
+            return 0.0  # empty password
         return self.length * log(self.alphabet_cardinality, 2)
 
     @cached_property
@@ -191,6 +274,8 @@ class PasswordStats(object):
         #     entropy_bits / (length * log(length, 2)) =
         #   = log(alphabet_cardinality, 2) / log(length, 2) =
         #   = log(alphabet_cardinality, length)
+        if self.length <= 1:
+            return float(self.length)  # empty password; a single character is unique
         return log(self.alphabet_cardinality, self.length)
 
     def strength(self, weak_bits=30):
@@ -242,6 +327,7 @@ class PasswordStats(object):
     #region Detectors
 
     _repeated_patterns_rex = re.compile(r'((.+?)\2+)', re.UNICODE | re.DOTALL | re.IGNORECASE)
+    _repeated_patterns_rex_ascii = re.compile(br'((.+?)\2+)', re.DOTALL | re.IGNORECASE)
 
     @cached_property
     def repeated_patterns_length(self):
@@ -251,8 +337,13 @@ class PasswordStats(object):
 
         :rtype: int
         """
+        if self._ascii is not None:
+            matches = self._repeated_patterns_rex_ascii.findall(self._ascii)
+        else:
+            matches = self._repeated_patterns_rex.findall(self.password)
+
         length = 0
-        for substring, pattern in self._repeated_patterns_rex.findall(self.password):
+        for substring, pattern in matches:
             length += len(substring)
         return length
 
@@ -263,6 +354,9 @@ class PasswordStats(object):
         '01234567890'  # Numbers
     )
     _sequences = _sequences + _sequences[::-1]  # reversed
+    _sequences_ascii = _sequences.encode('ascii')
+    _sequences_bigrams = _bigrams(_sequences)
+    _sequences_ascii_bigrams = _bigrams(_sequences_ascii)
 
     @cached_property
     def sequences_length(self):
@@ -276,33 +370,32 @@ class PasswordStats(object):
         :return: Total length of character sequences that are subsets of the common sequences
         :rtype: int
         """
-        # FIXME: Optimize this. I'm sure there is a better way!...
+        if self._ascii is not None:
+            return self._find_sequences(self._get_ascii_bytes(), self._sequences_ascii, self._sequences_ascii_bigrams)
+        return self._find_sequences(self.password, self._sequences, self._sequences_bigrams)
+
+    @staticmethod
+    def _find_sequences(password, sequences, bigrams):
+        """ Implementation of sequences_length() that works on both unicode and bytes
+
+        :param bigrams: All 2-character substrings of `sequences`
+        """
         sequences_length = 0
+        find = sequences.find
 
         # Iterate through the string, with manual variable (to allow skips)
         i = 0
-        while i < len(self.password):
-            # Slice (since we use it often)
-            password = self.password[i:]
-
-            # Iterate over sequences to find longest common prefix
-            j = -1
+        n = len(password)
+        while i < n:
+            # The longest common prefix with any of the sequences is the longest prefix that occurs in them.
+            # Most characters don't start one: check the first two characters with a set lookup.
+            # Then grow it one character at a time: substring search is done in C.
+            # (find() rather than `in`: it's faster with bytes)
             common_length = 1
-            while True:
-                # Detect the first match with the current character
-                # A character may appear multiple times
-                j = self._sequences.find(password[0], j+1)
-                if j == -1:
-                    break
-
-                # Find the longest common prefix
-                common_here = ''
-                for a, b in zip(password, self._sequences[j:]):
-                    if a != b: break
-                    else: common_here += a
-
-                # It it's longer than previous discoveries -- store it
-                common_length = max(common_length, len(common_here))
+            if password[i:i + 2] in bigrams:
+                common_length = 2
+                while i + common_length < n and find(password[i:i + common_length + 1]) != -1:
+                    common_length += 1
 
             # Repeated sequence?
             if common_length > 2:
@@ -330,18 +423,23 @@ class PasswordStats(object):
         :return: Weakness factor
         :rtype: float
         """
+        if not self.length:
+            return 0.0  # empty password
         return min(1.0, (self.repeated_patterns_length + self.sequences_length) / self.length)
 
     #endregion
 
-    def test(self, tests):
+    def test(self, tests, **context):
         """ Test the password against a list of tests
 
         :param tests: Test to do
         :type tests: Iterable[password_strength.tests.ATest]
+        :param context: Additional data for tests that need it, available to them as `ps.context`.
+            E.g. `history=[...]` and `identifiers=[...]` for `tests.EditDistance`
         :return: list of tests that have failed
         :rtype: list[tests.ATest]
         """
+        self.context = context
         return [t
                 for t in tests
                 if not t.test(self)]
@@ -1,6 +1,7 @@
 """ These objects perform individual tests on a password, and report `True` of `False`. """
 
 from .tests_base import ATest
+from .distance import Pattern as _Pattern
 
 
 class Length(ATest):
@@ -85,3 +86,32 @@ class Strength(ATest):
 
     def test(self, ps):
         return (1 - ps.weakness_factor) * ps.strength(self.weak_bits) >= self.strength
+
+
+class EditDistance(ATest):
+    """ Test whether the password is >= `distance` edits away from the user's previous passwords and identifiers.
+
+        Edit distance is the number of single-character insertions, deletions and substitutions
+        needed to turn one string into another. Comparison is case-insensitive.
+
+        This test needs context: pass the strings to compare with when testing:
+
+            policy.test(password, history=[...], identifiers=[username, email])
+
+        Without context, the test always passes.
+    """
+
+    needs_password = True
+
+    def __init__(self, distance):
+        super(EditDistance, self).__init__(distance)
+        self.distance = distance
+
+    def test(self, ps):
+        others = list(ps.context.get('history', ())) + list(ps.context.get('identifiers', ()))
+        if not others:
+            return True
+
+        pattern = _Pattern(ps.password.lower())
+        return all(pattern.distance(other.lower(), self.distance) >= self.distance
+                   for other in others)
@@ -29,6 +29,10 @@ class ATest(with_metaclass(ATestMeta, object)):
     #: Test classes map: { name : class }
     test_classes = {}
 
+    #: Whether the test needs the password itself, not just its statistics.
+    #: Such tests can't be used on a `StatsSnapshot`.
+    needs_password = False
+
     def __init__(self, *args):
         self.args = args  # Store args
 
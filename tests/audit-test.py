@@ -0,0 +1,65 @@
+import random
+import unittest
+from itertools import count
+from password_strength import PasswordPolicy, tests
+from password_strength.audit import SamplingAudit, reservoir_sample
+
+
+class AuditTest(unittest.TestCase):
+    """ Test: sampling audit """
+
+    def test_reservoir_sample(self):
+        rnd = random.Random(0)
+        self.assertEqual(reservoir_sample(range(5), 10, rnd), [0, 1, 2, 3, 4])
+        self.assertEqual(reservoir_sample(range(5), 0, rnd), [])
+
+        sample = reservoir_sample(range(100000), 1000, rnd)
+        self.assertEqual(len(set(sample)), 1000)
+        self.assertAlmostEqual(sum(sample) / len(sample), 50000, delta=5000)  # uniform: mean is in the middle
+
+    def test_audit(self):
+        policy = PasswordPolicy.from_names(length=8, numbers=1)
+
+        # Infinite corpus: 30% are short, 50% have no numbers
+        def corpus():
+            rnd = random.Random(0)
+            for i in count():
+                yield ('' if rnd.random() < 0.5 else '1') + ('abc' if rnd.random() < 0.3 else 'abcdefgh')
+
+        audit = SamplingAudit(policy, precision=0.02, confidence=0.95).run(corpus(), rate=0.5, random=random.Random(0))
+        self.assertTrue(audit.precise)
+        self.assertLess(audit.samples, 5000)
+
+        rates = audit.failure_rates()
+        self.assertEqual(set(rates), {'length', 'numbers'})
+        for name, expected in (('length', 0.3), ('numbers', 0.5)):
+            self.assertLessEqual(rates[name].high - rates[name].low, 0.04)
+            self.assertAlmostEqual(rates[name].value, expected, delta=0.04)
+        self.assertAlmostEqual(audit.rejection_rate().value, 1 - 0.7 * 0.5, delta=0.04)
+
+        distribution = audit.strength_distribution()
+        self.assertEqual(len(distribution), 10)
+        self.assertAlmostEqual(sum(e.value for e in distribution), 1.0)
+        mean = audit.mean_strength()
+        self.assertTrue(mean.low <= mean.value <= mean.high)
+
+    def test_empty(self):
+        policy = PasswordPolicy.from_names(length=8, strength=0.3)
+        audit = SamplingAudit(policy).run(['abc', '', 'long enough 12!'])
+        self.assertEqual(audit.samples, 3)
+        self.assertEqual(audit.report.failures['length'], 2)
+        self.assertEqual(audit.report.strength.counts[0], 2)
+
+    def test_same_name(self):
+        # Tests of the same class share a name: a password that fails both is counted once
+        policy = PasswordPolicy(tests.Length(8), tests.Length(12))
+        audit = SamplingAudit(policy).run(['abc'] * 150 + ['long enough'] * 50)
+        self.assertEqual(audit.report.failures['length'], audit.samples)
+        self.assertEqual(audit.failure_rates()['length'].value, 1.0)
+
+    def test_exhausted(self):
+        policy = PasswordPolicy.from_names(length=8)
+        audit = SamplingAudit(policy, precision=0.001).run(['short', 'long enough'] * 50)
+        self.assertFalse(audit.precise)
+        self.assertEqual(audit.samples, 100)
+        self.assertEqual(audit.failure_rates()['length'].value, 0.5)
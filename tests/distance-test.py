@@ -0,0 +1,26 @@
+import unittest
+from password_strength.distance import Pattern, edit_distance
+
+
+class DistanceTest(unittest.TestCase):
+    """ Test: edit distance """
+
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance('', ''), 0)
+        self.assertEqual(edit_distance('', 'abc'), 3)
+        self.assertEqual(edit_distance('abc', ''), 3)
+        self.assertEqual(edit_distance('abc', 'abc'), 0)
+        self.assertEqual(edit_distance('kitten', 'sitting'), 3)
+        self.assertEqual(edit_distance('flaw', 'lawn'), 2)
+        self.assertEqual(edit_distance('Summer2018!', 'Summer2019!'), 1)
+        self.assertEqual(edit_distance('x' * 100 + 'a', 'x' * 100 + 'b'), 1)  # longer than a machine word
+
+    def test_max_distance(self):
+        self.assertEqual(edit_distance('kitten', 'sitting', 2), 2)
+        self.assertEqual(edit_distance('kitten', 'sitting', 3), 3)
+        self.assertEqual(edit_distance('kitten', 'sitting', 4), 3)
+        self.assertEqual(edit_distance('a', 'abcdefgh', 3), 3)  # length difference
+        self.assertEqual(edit_distance('abcdefgh', 'zyxwvuts', 3), 3)  # early exit
+
+        pattern = Pattern('Summer2019!')
+        self.assertEqual([pattern.distance(s, 4) for s in ['Summer2018!', 'Winter2019!', 'qwerty']], [1, 4, 4])
@@ -2,6 +2,13 @@ import unittest
 from password_strength import PasswordPolicy, tests
 
 
+class _Broken(tests.ATest):
+    """ Test that fails with an exception on empty passwords """
+
+    def test(self, ps):
+        return 1 / ps.length > 0
+
+
 class PolicyTest(unittest.TestCase):
     """ Test: PasswordPolicy """
     longMessage = True
@@ -32,3 +39,35 @@ class PolicyTest(unittest.TestCase):
                 expects,
                 'Testing {}'.format(password)
             )
+
+    def test_many(self):
+        policy = PasswordPolicy.from_names(length=8, numbers=2)
+
+        self.assertEqual(
+            [{t.name() for t in failed} for failed in policy.test_many(['short', 'long enough', 'long enough 12'])],
+            [{'length', 'numbers'}, {'numbers'}, set()]
+        )
+
+        # Errors
+        policy = PasswordPolicy(tests.Length(8), _Broken())
+        self.assertRaises(ZeroDivisionError, list, policy.test_many(['long enough', '']))
+
+        results = list(policy.test_many(['short', '', 'long enough'], return_exceptions=True))
+        self.assertEqual([t.name() for t in results[0]], ['length'])
+        self.assertIsInstance(results[1], ZeroDivisionError)
+        self.assertEqual(results[2], [])
+
+    def test_context(self):
+        policy = PasswordPolicy.from_names(length=8, editdistance=3)
+
+        history = ['Summer2018!', 'Winter2018!']
+        identifiers = ['john.smith', 'john.smith@example.com']
+
+        self.assertEqual(policy.test('Summer2019!'), [])  # no context
+        self.assertEqual([t.name() for t in policy.test('summer2019!', history=history)], ['editdistance'])
+        self.assertEqual(policy.test('Autumn2019!', history=history, identifiers=identifiers), [])
+        self.assertEqual([t.name() for t in policy.test('John.Smith1', identifiers=identifiers)], ['editdistance'])
+
+        stats = policy.password('Summer2019!')
+        self.assertEqual([t.name() for t in stats.test(history=history)], ['editdistance'])
+        self.assertEqual(stats.test(), [])
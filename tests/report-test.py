@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import struct
+import unittest
+from functools import reduce
+from password_strength import PasswordPolicy
+from password_strength.report import AuditReport, Histogram
+
+
+class ReportTest(unittest.TestCase):
+    """ Test: AuditReport """
+
+    passwords = ['qazwsx', 'qazwsxrfvTG94@$', 'abcabcabc-1234', u'Mixed-汉堡包/漢堡包, 汉堡/漢堡', 'x' * 1000]
+
+    def test_histogram(self):
+        h = Histogram(0, 10, 10)
+        for value in [-5, 0, 1.5, 5, 9.99, 10, 100]:
+            h.add(value)
+        self.assertEqual(h.counts, [2, 1, 0, 0, 0, 1, 0, 0, 0, 3])
+        self.assertEqual(h.total, 7)
+
+        h = Histogram(0, 10, 10, [0, 0, 0, 0, 10, 10, 0, 0, 0, 0])
+        self.assertEqual(h.quantile(0.5), 5.0)
+        self.assertEqual(h.quantile(0.25), 4.5)
+        self.assertEqual(Histogram(0, 1, 2).quantile(0.5), None)
+
+        self.assertEqual((h + h).counts, [2 * n for n in h.counts])
+        self.assertRaises(ValueError, h.merge, Histogram(0, 10, 20))
+
+    def test_report(self):
+        policy = PasswordPolicy.from_names(length=8, numbers=2)
+        report = AuditReport().add_passwords(policy, self.passwords)
+
+        self.assertEqual(report.count, 5)
+        self.assertEqual(dict(report.failures), {'length': 1, 'numbers': 3})
+        self.assertEqual(report.length.total, 5)
+        self.assertEqual(report.length.counts[6], 1)
+        self.assertEqual(report.length.counts[-1], 1)  # 1000 is out of range
+        self.assertEqual(report.entropy_bits.total, 5)
+        self.assertEqual(report.strength.total, 5)
+        self.assertEqual(report.char_categories['N'], 2 + 4)
+
+    def test_empty(self):
+        policy = PasswordPolicy.from_names(length=8, strength=0.3)
+        report = AuditReport().add_passwords(policy, ['abc', ''])
+        self.assertEqual(report.count, 2)
+        self.assertEqual(dict(report.failures), {'length': 2, 'strength': 2})
+        self.assertEqual(report.strength.counts[0], 1)
+        self.assertEqual(report.length.counts[0], 1)
+        self.assertEqual(report.entropy_bits.counts[0], 1)
+
+    def test_merge(self):
+        policy = PasswordPolicy.from_names(length=8, numbers=2)
+        whole = AuditReport().add_passwords(policy, self.passwords)
+        shards = [AuditReport().add_passwords(policy, [password]) for password in self.passwords]
+
+        # Reduce in a different order, through serialization
+        shards = [AuditReport.loads(shard.dumps()) for shard in reversed(shards)]
+        self.assertEqual(reduce(lambda a, b: a + b, shards), whole)
+        self.assertEqual(AuditReport.loads(whole.dumps()), whole)
+        self.assertEqual(AuditReport() + whole, whole)
+
+        self.assertRaises(ValueError, whole.merge, AuditReport(strength_bins=10))
+        self.assertRaises(ValueError, whole.merge, AuditReport(weak_bits=20))
+
+    def test_serialization(self):
+        data = AuditReport().add_passwords(PasswordPolicy(), self.passwords).dumps()
+        self.assertRaises(ValueError, AuditReport.loads, b'')
+        self.assertRaises(ValueError, AuditReport.loads, b'XX' + data[2:])
+        self.assertRaises(ValueError, AuditReport.loads, data[:-1])
+        self.assertRaises(ValueError, AuditReport.loads, data + b'\x00')
+
+        # Any weak_bits
+        report = AuditReport(weak_bits=30.5).add_passwords(PasswordPolicy(), self.passwords)
+        self.assertEqual(AuditReport.loads(report.dumps()).weak_bits, 30.5)
+
+        # Malformed histograms: the strength histogram goes right after the header and two empty counters
+        data = AuditReport().dumps()
+        self.assertEqual(data[14:31], struct.pack('<dd', 0, 1) + b'\x14')
+        self.assertRaises(ValueError, AuditReport.loads, data[:14] + struct.pack('<dd', 1, 1) + data[30:])
+        self.assertRaises(ValueError, AuditReport.loads, data[:14] + struct.pack('<dd', 1, 0) + data[30:])
+        self.assertRaises(ValueError, AuditReport.loads, data[:30] + b'\x00' + data[31:])
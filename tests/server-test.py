@@ -0,0 +1,110 @@
+import json
+import threading
+import unittest
+from six.moves import http_client
+
+from password_strength import PasswordPolicy
+from password_strength.tests import ATest
+from password_strength.server import Batcher, ScoringServer
+
+
+class _Broken(ATest):
+    """ Test that fails with an exception on empty passwords """
+
+    def test(self, ps):
+        return 1 / ps.length > 0
+
+
+class ServerTest(unittest.TestCase):
+    """ Test: scoring server """
+
+    def setUp(self):
+        self.policy = PasswordPolicy.from_names(length=8, numbers=2)
+
+    def test_batcher(self):
+        batcher = Batcher(self.policy, max_batch=16).start()
+        passwords = ['short', 'long enough', 'long enough 12', 'sh12']
+        results = [None] * len(passwords)
+
+        def submit(i):
+            results[i] = batcher.submit([passwords[i]])[0]
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(len(passwords))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        batcher.stop()
+
+        self.assertEqual(
+            [{t.name() for t in result} for result in results],
+            [{'length', 'numbers'}, {'numbers'}, set(), {'length'}]
+        )
+
+    def test_batcher_errors(self):
+        policy = PasswordPolicy(_Broken())
+        batcher = Batcher(policy, max_batch=16, max_delay=0.05).start()
+        passwords = ['goodPassw0rd!', '', 'another0ne?']
+        results = [None] * len(passwords)
+
+        def submit(i):
+            try:
+                results[i] = batcher.submit([passwords[i]])[0]
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(len(passwords))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        batcher.stop()
+
+        self.assertEqual(results[0], [])
+        self.assertIsInstance(results[1], Exception)
+        self.assertEqual(results[2], [])
+
+    def test_http(self):
+        server = ScoringServer(('127.0.0.1', 0), self.policy)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        conn = http_client.HTTPConnection(*server.server_address)
+
+        def request(method, path, body=None):
+            conn.request(method, path, body)
+            response = conn.getresponse()
+            return response.status, response.read().decode('utf-8')
+
+        try:
+            self.assertEqual(request('GET', '/health')[0], 200)
+
+            status, body = request('POST', '/test', json.dumps({'password': 'short'}))
+            self.assertEqual(status, 200)
+            self.assertEqual(set(json.loads(body)['failed']), {'length', 'numbers'})
+
+            status, body = request('POST', '/test', json.dumps({'passwords': ['short', 'long enough 12']}))
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body)['failed'][1], [])
+
+            self.assertEqual(request('POST', '/test', 'nonsense')[0], 400)
+            for body in ({'password': None}, {'password': 123}, {'passwords': 'abc'}, {'passwords': ['a', 1]}, ['abc'], {}):
+                conn.close()  # 400 closes the connection
+                self.assertEqual(request('POST', '/test', json.dumps(body))[0], 400, body)
+            conn.close()
+
+            conn.putrequest('POST', '/test')
+            conn.putheader('Content-Length', '-1')
+            conn.endheaders()
+            self.assertEqual(conn.getresponse().status, 400)
+            conn.close()
+
+            self.assertEqual(request('GET', '/nonsense')[0], 404)
+
+            status, body = request('GET', '/metrics')
+            self.assertIn('password_strength_requests_total 10\n', body)
+            self.assertIn('password_strength_passwords_total 3\n', body)
+        finally:
+            conn.close()
+            server.shutdown()
+            thread.join()
+            server.server_close()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from password_strength import PasswordPolicy, PasswordStats, StatsSnapshot
+
+
+class SnapshotTest(unittest.TestCase):
+    """ Test: StatsSnapshot """
+
+    passwords = ['qazwsx', 'qazwsxrfvTG94@$', 'abcabcabc-1234', u'Mixed-汉堡包/漢堡包, 汉堡/漢堡', 'x' * 1000]
+
+    def test_stats(self):
+        for password in self.passwords:
+            stats = PasswordStats(password)
+            snapshot = StatsSnapshot.loads(StatsSnapshot.from_stats(stats).dumps())
+
+            for name in StatsSnapshot.fields:
+                self.assertEqual(getattr(snapshot, name), getattr(stats, name), name)
+            self.assertEqual(snapshot.entropy_bits, stats.entropy_bits)
+            self.assertEqual(snapshot.weakness_factor, stats.weakness_factor)
+            self.assertEqual(snapshot.strength(20), stats.strength(20))
+
+        self.assertRaises(AttributeError, lambda: snapshot.password)
+
+    def test_serialization(self):
+        snapshots = [StatsSnapshot.from_stats(PasswordStats(password)) for password in self.passwords]
+        data = b''.join(s.dumps() for s in snapshots)
+
+        self.assertEqual(len(snapshots[0].dumps()), 3 + 9)
+        self.assertEqual(list(StatsSnapshot.iterloads(data)), snapshots)
+
+        self.assertRaises(ValueError, StatsSnapshot.loads, b'')
+        self.assertRaises(ValueError, StatsSnapshot.loads, b'XX\x01' + b'\x00' * 9)
+        self.assertRaises(ValueError, StatsSnapshot.loads, b'PS\x63' + b'\x00' * 9)
+        self.assertRaises(ValueError, StatsSnapshot.loads, snapshots[0].dumps()[:-1])
+        self.assertRaises(ValueError, StatsSnapshot.loads, snapshots[0].dumps() + b'\x00')
+
+    def test_invalid(self):
+        fields = dict.fromkeys(StatsSnapshot.fields, 1)
+        self.assertRaises(TypeError, StatsSnapshot, length=1)
+        self.assertRaises(ValueError, StatsSnapshot, **dict(fields, length=-1))
+
+        policy = PasswordPolicy.from_names(length=8, editdistance=3)
+        self.assertRaises(ValueError, policy.test_snapshots, [StatsSnapshot(**fields)])
+
+    def test_policy(self):
+        policy = PasswordPolicy.from_names(
+            length=8,
+            uppercase=2,
+            numbers=2,
+            special=2,
+            nonletters=2,
+            nonletterslc=2,
+            entropybits=30,
+            strength=(0.333, 30)
+        )
+
+        snapshots = [StatsSnapshot.from_stats(PasswordStats(password)) for password in self.passwords]
+        self.assertEqual(
+            [{t.name() for t in failed} for failed in policy.test_snapshots([s.dumps() for s in snapshots])],
+            [{t.name() for t in failed} for failed in policy.test_many(self.passwords)],
+        )
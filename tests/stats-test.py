@@ -2,6 +2,7 @@
 
 import unittest
 import six
+from array import array
 from password_strength import PasswordStats
 
 
@@ -79,6 +80,12 @@ class StatsTest(unittest.TestCase):
         self.assertAlmostEqual(PasswordStats( p896).strength(), 0.99,   delta=0.01)
         self.assertAlmostEqual(PasswordStats(p2048).strength(), 1.00,   delta=0.01)
 
+        self.assertEqual(PasswordStats('').entropy_bits, 0.0)
+        self.assertEqual(PasswordStats('').strength(), 0.0)
+        self.assertEqual(PasswordStats('').weakness_factor, 0.0)
+        self.assertEqual(PasswordStats('').entropy_density, 0.0)
+        self.assertEqual(PasswordStats('a').entropy_density, 1.0)
+
         self.assertAlmostEqual(PasswordStats( p2).weakness_factor, 0.0,   delta=0.01)
         self.assertAlmostEqual(PasswordStats( p8).weakness_factor, 0.875, delta=0.01)
         self.assertAlmostEqual(PasswordStats(p24).weakness_factor, 1.0,   delta=0.01)
@@ -94,3 +101,30 @@ class StatsTest(unittest.TestCase):
         self.assertEqual(PasswordStats('qwe...').sequences_length, 3)
         self.assertEqual(PasswordStats('qwerty...').sequences_length, 6)
         self.assertEqual(PasswordStats('ZZqwertyZZ1234...').sequences_length, 10)
+
+    def test_buffers(self):
+        names = ('alphabet', 'char_categories_detailed', 'length', 'letters_uppercase', 'numbers', 'special_characters',
+                 'entropy_bits', 'repeated_patterns_length', 'sequences_length', 'weakness_factor')
+
+        for password in (u'qwerty', u'abcABC-1234 abcabc', u'aAA111!!!!      \0\x7f', u'Mixed-汉堡包/漢堡包'):
+            expected = PasswordStats(password)
+            for buffer in (password.encode('utf-8'), bytearray(password.encode('utf-8')), memoryview(password.encode('utf-8'))):
+                s = PasswordStats(buffer)
+                for name in names:
+                    self.assertEqual(getattr(s, name), getattr(expected, name), '{!r}.{}'.format(password, name))
+                self.assertEqual(s.password, password)
+
+        # Pure ASCII is never decoded
+        s = PasswordStats(b'qwerty123')
+        self.assertEqual(s.strength(), PasswordStats(u'qwerty123').strength())
+        self.assertEqual(s._password, None)
+
+        # Invalid UTF-8 fails right away
+        self.assertRaises(UnicodeDecodeError, PasswordStats, b'abc\xff')
+        self.assertRaises(UnicodeDecodeError, PasswordStats, memoryview(b'abc\xff'))
+
+        # Only contiguous views of bytes
+        self.assertRaises(TypeError, PasswordStats, memoryview(array('i', [65, 66, 67])))
+        self.assertRaises(TypeError, PasswordStats, memoryview(b'abcdef')[::2])
+        self.assertEqual(PasswordStats(memoryview(b'abcdef')[1:4]).password, u'bcd')
+        self.assertEqual(PasswordStats(memoryview(b'')).length, 0)